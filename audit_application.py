@@ -20,21 +20,66 @@ Generates prioritized fixes and iterates until 100% pass rate.
 import os
 import re
 import json
+import logging
 import ast
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, Iterator, List, Tuple, Any, Optional, TextIO
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
+from itertools import chain, repeat
 
-class Severity(Enum):
-    CRITICAL = "CRITICAL"
-    HIGH = "HIGH" 
-    MEDIUM = "MEDIUM"
-    LOW = "LOW"
+try:
+    import ahocorasick
+except ImportError:  # optional: speeds up the brand color scan
+    ahocorasick = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing
+    orjson = None
+
+from audit_scanners import color_hit_lines, scan_imports, scan_source
+
+logger = logging.getLogger(__name__)
+
+# Below this many files the per-file checks run serially; pool startup costs more
+PARALLEL_MIN_FILES = 32
+# Most files handed to a worker per round trip, to amortize pickling overhead
+SCAN_CHUNKSIZE = 64
+
+# Concurrent reads when prefetching source files for the serial checks
+READ_CONCURRENCY = 32
+
+# Incremental build info for the tsc check, relative to the audited root
+TS_BUILD_INFO_FILE = ".audit.tsbuildinfo"
+# Per-file check results saved between runs, relative to the audited root
+RESULT_CACHE_FILE = ".audit_cache.json"
+
+# Patterns used by the per-file checks, compiled once at import time
+_TS_ERROR_RE = re.compile(r'^(.+?)\((\d+),\d+\): error TS\d+: (.+)$', re.MULTILINE)
+# app.<method>('<path>') and router.<method>('<path>') in one pass
+_ROUTE_RE = re.compile(r'(?:app|router)\.(get|post|put|delete)\([\'"]([^\'"]+)[\'"]')
+_QUERY_KEY_RE = re.compile(r'queryKey:\s*\[[\'"]([^\'"]+)[\'"]')
+_TAILWIND_COLOR_RE = re.compile(r'className=[\'"][^\'\"]*(?:bg-|text-|border-)(blue|red|green|yellow|purple|pink|indigo|violet)[^\'\"]*[\'"]')
+_ENV_VAR_RE = re.compile(r'process\.env\.([A-Z_]+)')
+
+class Severity(IntEnum):
+    # Ordered most severe first, so severities compare and sort as integers
+    CRITICAL = 0
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
+
+# Slotted: an audit can hold thousands of these, and dropping the per-instance
+# __dict__ cuts each one by about a third. dataclass only accepts slots= from
+# Python 3.10; older interpreters get a plain (unslotted) dataclass.
+_SLOTTED = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTTED)
 class Issue:
     file_path: str
     line_number: int
@@ -53,6 +98,48 @@ class AuditResults:
     high_count: int = 0
     medium_count: int = 0
     low_count: int = 0
+    
+    def reset(self):
+        """Clear the results in place for another audit"""
+        self.issues.clear()
+        self.total_files_scanned = 0
+        self.pass_rate = 0.0
+        self.critical_count = 0
+        self.high_count = 0
+        self.medium_count = 0
+        self.low_count = 0
+
+@dataclass
+class FileResult:
+    """Issues from one file's per-file checks, with the paths they depended on"""
+    issues: List[Issue]
+    # Paths the file's relative imports resolved to; the result is stale once
+    # any of them is gone
+    resolved_imports: List[str] = field(default_factory=list)
+    # Every candidate path of the imports that didn't resolve; the result is
+    # stale once any of them exists
+    missing_imports: List[str] = field(default_factory=list)
+
+_SEVERITY_ICONS = {
+    Severity.CRITICAL: "🔴",
+    Severity.HIGH: "🟠",
+    Severity.MEDIUM: "🟡",
+    Severity.LOW: "🟢",
+}
+
+# Issue details for each finding kind reported by audit_scanners.scan_source
+_SOURCE_FINDINGS = {
+    'any': (Severity.MEDIUM, "Type Safety", "Using 'any' type",
+            "Replace 'any' with specific type"),
+    'fn_noret': (Severity.LOW, "Type Safety", "Function missing return type",
+                 "Add explicit return type to function"),
+    'hook': (Severity.HIGH, "React Hooks", "Hook called conditionally",
+             "Move hook call outside conditional logic"),
+    'console': (Severity.LOW, "Code Quality", "console.log found",
+                "Remove console.log or replace with proper logging"),
+    'todo': (Severity.LOW, "Code Quality", "TODO/FIXME comment found",
+             "Complete or remove TODO/FIXME comment"),
+}
 
 class ClinicalAppAuditor:
     def __init__(self, root_path: str = "."):
@@ -79,9 +166,108 @@ class ClinicalAppAuditor:
         self.config_patterns = ["**/*.json", "**/*.config.*", "**/tsconfig.json"]
         self.style_patterns = ["**/*.css", "**/*.scss", "**/*.sass"]
         
+        # Suffix sets for the patterns above, so one walk can bucket every file
+        self._ts_exts = frozenset(os.path.splitext(p)[1] for p in self.typescript_patterns)
+        self._style_exts = frozenset(os.path.splitext(p)[1] for p in self.style_patterns)
+        
+        # Directories never descended into when indexing files
+        self.excluded_dirs = {"node_modules", ".git", "dist", "build"}
+        
+        # File index, populated once per audit by _index_files
+        self._ts_files: List[str] = []
+        self._style_files: List[str] = []
+        self._client_tsx_files: List[str] = []
+        # Normalized paths of every file and directory seen by the walk
+        self._known_paths: set = set()
+        
+        # File contents keyed by path, so each file is read only once per audit
+        self._file_cache: Dict[str, str] = {}
+        # Parsed JSON config files, shared by the checks that read them
+        self._json_cache: Dict[Path, Any] = {}
+        # Per-file check results keyed by (path, mtime_ns, size); unlike the
+        # caches above this survives between audits
+        self._result_cache: Dict[Tuple[str, int, int], FileResult] = {}
+        # Import targets resolved, and candidates probed in vain, by the file
+        # currently being checked
+        self._resolved_imports: List[str] = []
+        self._missing_imports: List[str] = []
+        # Whether RESULT_CACHE_FILE has been read yet, and whether the cache
+        # has changed since it was last read or written
+        self._result_cache_loaded = False
+        self._result_cache_dirty = False
+        
+        # Recorded issues grouped by severity, in insertion order
+        self._issues_by_severity: Dict[Severity, List[Issue]] = {s: [] for s in Severity}
+        
+        # Worker processes used for the per-file checks. The pool outlives a
+        # single audit and is reused by later ones, grown only when a larger
+        # batch needs more workers than it has; close() shuts it down.
+        self.max_workers = os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        
+        # Built last, since a rebuild also drops state derived from the old colors
+        self._build_color_matchers()
+        
+    def _build_color_matchers(self):
+        """Compile the forbidden color matchers; call again after changing forbidden_colors"""
+        # Multi-pattern matcher for forbidden colors: an Aho-Corasick automaton
+        # when pyahocorasick is installed, else one regex over all colors. The
+        # regex sits in a lookahead so, like the automaton, it reports colors
+        # that overlap (e.g. '#blue' and 'blue-' in '#blue-'). It tries longer
+        # colors first, so at each offset it finds the longest color there;
+        # every other color matching at that offset is a prefix of it, and is
+        # reported through _color_prefixes.
+        longest_first = sorted(set(self.forbidden_colors), key=len, reverse=True)
+        self._color_re = re.compile(
+            '(?=(' + '|'.join(re.escape(color) for color in longest_first) + '))'
+        )
+        self._color_prefixes: Dict[str, List[int]] = {
+            color: [index for index, other in enumerate(self.forbidden_colors)
+                    if color.startswith(other)]
+            for color in longest_first
+        }
+        self._color_automaton = None
+        if ahocorasick is not None:
+            # Each word carries every index it has in forbidden_colors, so a
+            # color listed twice is reported twice, as the line loop did
+            self._color_automaton = ahocorasick.Automaton(ahocorasick.STORE_ANY)
+            for color in longest_first:
+                self._color_automaton.add_word(color, [
+                    index for index, other in enumerate(self.forbidden_colors)
+                    if other == color
+                ])
+            self._color_automaton.make_automaton()
+        
+        # Cached per-file results were produced with the previous colors, and
+        # pool workers got their copy of the matchers when they started
+        if self._result_cache:
+            self._result_cache = {}
+            self._result_cache_dirty = True
+        self.close()
+    
+    def __getstate__(self):
+        # Workers only need configuration, not results or cached contents; the
+        # file index is sent along with each batch of jobs
+        state = self.__dict__.copy()
+        state['results'] = AuditResults()
+        state['_issues_by_severity'] = {s: [] for s in Severity}
+        state['_file_cache'] = {}
+        state['_json_cache'] = {}
+        state['_result_cache'] = {}
+        state['_known_paths'] = set()
+        state['_pool'] = None
+        state['_pool_workers'] = 0
+        return state
+        
     def run_audit(self) -> AuditResults:
         """Main audit runner"""
-        print("🔍 Starting comprehensive clinical application audit...")
+        logger.info("🔍 Starting comprehensive clinical application audit...")
+        
+        self.results.reset()
+        for issues in self._issues_by_severity.values():
+            issues.clear()
+        self._index_files()
         
         # Critical checks first
         self._check_typescript_compilation()
@@ -89,44 +275,113 @@ class ClinicalAppAuditor:
         self._check_database_schema_consistency()
         self._check_api_route_consistency()
         
-        # High priority checks
-        self._check_import_export_issues()
-        self._check_component_structure()
-        self._check_react_hooks_usage()
-        self._check_type_safety()
+        # Per-file checks: imports, components, hooks, types, colors, env, quality
+        self._check_source_files()
+        self._save_result_cache()
         
         # Medium priority checks
-        self._check_brand_color_compliance()
         self._check_configuration_files()
-        self._check_environment_variables()
         
         # Low priority checks
-        self._check_code_quality()
         self._check_documentation()
         
         self._calculate_results()
         return self.results
     
+    def _index_files(self):
+        """Walk the tree once and bucket source files by extension"""
+        self._ts_files = []
+        self._style_files = []
+        self._file_cache = {}
+        self._json_cache = {}
+        self._known_paths = set()
+        
+        # '' stands for the current directory so paths keep no './' prefix
+        root = os.path.normpath(self.root_path)
+        if root == '.':
+            root = ''
+        for file_path in self._iter_files(root):
+            ext = os.path.splitext(file_path)[1]
+            if ext in self._ts_exts:
+                self._ts_files.append(file_path)
+            elif ext in self._style_exts:
+                self._style_files.append(file_path)
+                
+        client_prefix = os.path.join(root, 'client', 'src', '')
+        self._client_tsx_files = [
+            p for p in self._ts_files
+            if p.endswith('.tsx') and p.startswith(client_prefix)
+        ]
+    
+    def _iter_files(self, dirpath: str) -> Iterator[str]:
+        """Yield file paths under dirpath, recording every path in _known_paths"""
+        try:
+            entries = os.scandir(dirpath or '.')
+        except OSError:
+            # Unreadable or missing directories are skipped, as os.walk does
+            return
+        with entries:
+            for entry in entries:
+                path = os.path.join(dirpath, entry.name) if dirpath else entry.name
+                self._known_paths.add(path)
+                # DirEntry caches its type from the directory read, so these
+                # checks cost no extra stat; symlinked dirs are not followed
+                if entry.is_dir():
+                    if entry.name not in self.excluded_dirs and not entry.is_symlink():
+                        yield from self._iter_files(path)
+                else:
+                    yield path
+    
+    def _load(self, file_path: str) -> str:
+        """Return the content of a file, reading it once"""
+        content = self._file_cache.get(file_path)
+        if content is None:
+            content = _read_source(file_path)
+            self._file_cache[file_path] = content
+        return content
+    
+    def _prefetch(self, file_paths: List[str]):
+        """Read files into the cache on a thread pool, overlapping their I/O waits"""
+        missing = [p for p in file_paths if p not in self._file_cache]
+        if len(missing) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=min(READ_CONCURRENCY, len(missing))) as pool:
+            for file_path, content in zip(missing, pool.map(_read_text, missing)):
+                # Unreadable files are left out and fail again in _load
+                if content is not None:
+                    self._file_cache[file_path] = content
+    
+    def _load_json(self, json_path: Path) -> Any:
+        """Parse a JSON file once per audit; parse errors propagate to the caller"""
+        if json_path not in self._json_cache:
+            if orjson is not None:
+                data = orjson.loads(json_path.read_bytes())
+            else:
+                with open(json_path) as f:
+                    data = json.load(f)
+            self._json_cache[json_path] = data
+        return self._json_cache[json_path]
+    
     def _check_typescript_compilation(self):
         """Check for TypeScript compilation errors"""
-        print("📝 Checking TypeScript compilation...")
+        logger.info("📝 Checking TypeScript compilation...")
         
         try:
-            # Run TypeScript compiler check
+            # Run TypeScript compiler check. Build info is kept between runs so
+            # repeated audits only re-check files that changed.
             result = subprocess.run(
-                ["npx", "tsc", "--noEmit", "--skipLibCheck"],
+                ["npx", "tsc", "--noEmit", "--skipLibCheck",
+                 "--incremental", "--tsBuildInfoFile", TS_BUILD_INFO_FILE,
+                 "--pretty", "false"],
                 capture_output=True,
                 text=True,
                 cwd=self.root_path
             )
             
             if result.returncode != 0:
-                # Parse TypeScript errors
-                errors = result.stderr.split('\n')
-                for error in errors:
-                    if error.strip() and not error.startswith('Found'):
-                        self._parse_typescript_error(error)
-                        
+                # tsc reports diagnostics on stdout; parse both streams
+                self._parse_typescript_errors(result.stdout + result.stderr)
+                
         except Exception as e:
             self._add_issue(
                 "tsconfig.json", 0, Severity.CRITICAL,
@@ -134,13 +389,10 @@ class ClinicalAppAuditor:
                 "Ensure TypeScript is properly installed and configured"
             )
     
-    def _parse_typescript_error(self, error_line: str):
+    def _parse_typescript_errors(self, output: str):
         """Parse TypeScript error output"""
         # Pattern: file(line,col): error TS#### message
-        pattern = r'(.+?)\((\d+),\d+\): error TS\d+: (.+)'
-        match = re.match(pattern, error_line)
-        
-        if match:
+        for match in _TS_ERROR_RE.finditer(output):
             file_path, line_num, message = match.groups()
             self._add_issue(
                 file_path, int(line_num), Severity.CRITICAL,
@@ -150,7 +402,7 @@ class ClinicalAppAuditor:
     
     def _check_missing_dependencies(self):
         """Check for missing NPM dependencies"""
-        print("📦 Checking dependencies...")
+        logger.info("📦 Checking dependencies...")
         
         package_json_path = self.root_path / "package.json"
         if not package_json_path.exists():
@@ -162,8 +414,7 @@ class ClinicalAppAuditor:
             return
             
         try:
-            with open(package_json_path) as f:
-                package_data = json.load(f)
+            package_data = self._load_json(package_json_path)
                 
             dependencies = {**package_data.get('dependencies', {}), 
                           **package_data.get('devDependencies', {})}
@@ -191,7 +442,7 @@ class ClinicalAppAuditor:
     
     def _check_database_schema_consistency(self):
         """Check database schema consistency"""
-        print("🗄️ Checking database schema...")
+        logger.info("🗄️ Checking database schema...")
         
         schema_path = self.root_path / "shared" / "schema.ts"
         if not schema_path.exists():
@@ -204,8 +455,7 @@ class ClinicalAppAuditor:
             
         # Check for common schema issues
         try:
-            with open(schema_path) as f:
-                content = f.read()
+            content = self._load(str(schema_path))
                 
             # Check for missing exports
             if "export const" not in content:
@@ -232,32 +482,20 @@ class ClinicalAppAuditor:
     
     def _check_api_route_consistency(self):
         """Check API route consistency"""
-        print("🛣️ Checking API routes...")
+        logger.info("🛣️ Checking API routes...")
         
         # Check server routes
         routes_path = self.root_path / "server" / "routes.ts"
         if routes_path.exists():
             self._check_server_routes(routes_path)
-            
-        # Check client API calls
-        self._check_client_api_calls()
     
     def _check_server_routes(self, routes_path: Path):
         """Check server-side route definitions"""
         try:
-            with open(routes_path) as f:
-                content = f.read()
+            content = self._load(str(routes_path))
                 
             # Find all route definitions
-            route_patterns = [
-                r'app\.(get|post|put|delete)\([\'"]([^\'"]+)[\'"]',
-                r'router\.(get|post|put|delete)\([\'"]([^\'"]+)[\'"]'
-            ]
-            
-            routes = []
-            for pattern in route_patterns:
-                matches = re.findall(pattern, content)
-                routes.extend([(method.upper(), path) for method, path in matches])
+            routes = [(method.upper(), path) for method, path in _ROUTE_RE.findall(content)]
                 
             # Check for inconsistent route patterns
             for method, path in routes:
@@ -275,246 +513,306 @@ class ClinicalAppAuditor:
                 "Fix routes file syntax"
             )
     
-    def _check_client_api_calls(self):
-        """Check client-side API calls for consistency"""
-        client_dir = self.root_path / "client" / "src"
-        if not client_dir.exists():
+    def _check_source_files(self):
+        """Run every per-file check, fanning out to worker processes on large trees"""
+        logger.info("📂 Checking source files (imports, components, hooks, types, colors, env, quality)...")
+        
+        client_files = set(self._client_tsx_files)
+        jobs = [(p, p in client_files, False) for p in self._ts_files]
+        jobs.extend((p, False, True) for p in self._style_files)
+        
+        # Issues from an earlier audit are reused for files whose stat key is
+        # unchanged and whose imports still resolve the same way
+        if not self._result_cache_loaded:
+            self._load_result_cache()
+        keys = [_stat_key(job[0]) for job in jobs]
+        cached = [self._result_cache.get(key) for key in keys]
+        cached = [hit if hit is not None and self._is_current(hit) else None for hit in cached]
+        misses = [job for job, hit in zip(jobs, cached) if hit is None]
+        
+        # Keep only entries for files as they are now; misses are added below
+        previous_size = len(self._result_cache)
+        self._result_cache = {key: hit for key, hit in zip(keys, cached) if hit is not None}
+        if misses or len(self._result_cache) != previous_size:
+            self._result_cache_dirty = True
+        
+        if self.max_workers <= 1 or len(misses) < PARALLEL_MIN_FILES:
+            self._prefetch([job[0] for job in misses])
+            for job, key, hit in zip(jobs, keys, cached):
+                if hit is not None:
+                    for issue in hit.issues:
+                        self._record_issue(issue)
+                    continue
+                start = len(self.results.issues)
+                self._check_file(*job)
+                if key is not None:
+                    self._result_cache[key] = FileResult(self.results.issues[start:],
+                                                         self._resolved_imports,
+                                                         self._missing_imports)
             return
             
-        for file_path in client_dir.rglob("*.tsx"):
-            try:
-                with open(file_path) as f:
-                    content = f.read()
-                    
-                # Find useQuery calls
-                query_pattern = r'queryKey:\s*\[[\'"]([^\'"]+)[\'"]'
-                queries = re.findall(query_pattern, content)
-                
-                for query in queries:
-                    if not query.startswith('/api/'):
-                        self._add_issue(
-                            str(file_path), 0, Severity.MEDIUM,
-                            "API Calls", f"Query key {query} doesn't follow /api/ convention",
-                            f"Update query key to start with /api/"
-                        )
-                        
-            except Exception:
-                continue
+        # Large batches amortize IPC, but keep a few per worker so a slow batch
+        # doesn't leave the other workers idle at the end. Every job refers to
+        # the same path set, and pickle writes a shared object once per batch,
+        # so the file index costs one copy per batch rather than per file.
+        workers = min(self.max_workers, len(misses))
+        chunksize = max(1, min(SCAN_CHUNKSIZE, len(misses) // (workers * 4)))
+        fresh = self._scan_pool(workers).map(scan_file, misses, repeat(self._known_paths),
+                                             chunksize=chunksize)
+        for key, hit in zip(keys, cached):
+            if hit is None:
+                hit = next(fresh)
+                if key is not None:
+                    self._result_cache[key] = hit
+            for issue in hit.issues:
+                self._record_issue(issue)
     
-    def _check_import_export_issues(self):
-        """Check for import/export issues"""
-        print("📥 Checking imports/exports...")
-        
-        for pattern in self.typescript_patterns:
-            for file_path in self.root_path.rglob(pattern):
-                if 'node_modules' in str(file_path):
-                    continue
-                self._check_file_imports(file_path)
+    def _path_exists(self, path: str) -> bool:
+        """Check a path against the file index, then the filesystem"""
+        # The filesystem covers targets outside the indexed tree
+        # (excluded dirs, above root)
+        return path in self._known_paths or os.path.exists(path)
     
-    def _check_file_imports(self, file_path: Path):
-        """Check individual file for import issues"""
+    def _is_current(self, result: FileResult) -> bool:
+        """Whether a cached result's imports still resolve as they did"""
+        return (all(self._path_exists(p) for p in result.resolved_imports)
+                and not any(self._path_exists(p) for p in result.missing_imports))
+    
+    def _scan_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Return a worker pool with at least the given number of workers"""
+        # Workers receive the auditor's configuration once, at startup, and
+        # _build_color_matchers closes the pool when it changes; the file
+        # index changes between audits, so it travels with the jobs instead
+        if self._pool is not None and self._pool_workers < workers:
+            self.close()
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=workers,
+                                             initializer=_init_scan_worker,
+                                             initargs=(self,))
+            self._pool_workers = workers
+        return self._pool
+    
+    def close(self):
+        """Shut down the worker pool kept between audits, if one was started"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_workers = 0
+    
+    def _load_result_cache(self):
+        """Seed the per-file result cache from a previous run's RESULT_CACHE_FILE"""
+        self._result_cache_loaded = True
         try:
-            with open(file_path) as f:
-                content = f.read()
-                
-            lines = content.split('\n')
-            for i, line in enumerate(lines, 1):
-                line = line.strip()
-                
-                # Check for invalid import paths
-                if line.startswith('import') and 'from' in line:
-                    import_match = re.search(r'from [\'"]([^\'"]+)[\'"]', line)
-                    if import_match:
-                        import_path = import_match.group(1)
-                        
-                        # Check relative imports
-                        if import_path.startswith('./') or import_path.startswith('../'):
-                            # Resolve relative path
-                            resolved_path = (file_path.parent / import_path).resolve()
-                            possible_files = [
-                                resolved_path,
-                                resolved_path.with_suffix('.ts'),
-                                resolved_path.with_suffix('.tsx'),
-                                resolved_path / 'index.ts',
-                                resolved_path / 'index.tsx'
-                            ]
-                            
-                            if not any(p.exists() for p in possible_files):
-                                self._add_issue(
-                                    str(file_path), i, Severity.HIGH,
-                                    "Imports", f"Import path not found: {import_path}",
-                                    f"Fix import path or create missing file"
-                                )
-                                
-        except Exception:
-            pass
+            raw = (self.root_path / RESULT_CACHE_FILE).read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            # Results from a different version or configuration of the checks
+            # don't apply
+            if data['checks'] != self._checks_key():
+                return
+            self._result_cache = {
+                (path, mtime_ns, size): FileResult([
+                    Issue(file_path, line_number, Severity(severity), category,
+                          description, fix_suggestion, code_snippet)
+                    for file_path, line_number, severity, category,
+                        description, fix_suggestion, code_snippet in issues
+                ], resolved_imports, missing_imports)
+                for path, mtime_ns, size, issues, resolved_imports, missing_imports in data['files']
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or unreadable caches just mean a full scan
+            self._result_cache = {}
     
-    def _check_component_structure(self):
-        """Check React component structure"""
-        print("⚛️ Checking React components...")
-        
-        client_dir = self.root_path / "client" / "src"
-        if not client_dir.exists():
-            return
-            
-        for file_path in client_dir.rglob("*.tsx"):
-            self._check_react_component(file_path)
+    def _checks_key(self) -> List[Any]:
+        """Return a value that changes whenever cached per-file results would"""
+        # Color issues name the forbidden color and list the brand colors.
+        # Plain lists, so the value compares equal after a JSON round trip.
+        return [_checks_signature(), list(self.forbidden_colors),
+                [[name, value] for name, value in self.brand_colors.items()]]
     
-    def _check_react_component(self, file_path: Path):
-        """Check individual React component"""
+    def _save_result_cache(self):
+        """Write the per-file result cache to RESULT_CACHE_FILE if it changed"""
+        if not self._result_cache_dirty:
+            return
+        data = {
+            'checks': self._checks_key(),
+            'files': [
+                [path, mtime_ns, size, [
+                    [i.file_path, i.line_number, int(i.severity), i.category,
+                     i.description, i.fix_suggestion, i.code_snippet]
+                    for i in result.issues
+                ], result.resolved_imports, result.missing_imports]
+                for (path, mtime_ns, size), result in self._result_cache.items()
+            ],
+        }
+        payload = orjson.dumps(data) if orjson is not None else json.dumps(data).encode('utf-8')
         try:
-            with open(file_path) as f:
-                content = f.read()
-                
-            # Check for proper default export
-            if not re.search(r'export default', content):
-                self._add_issue(
-                    str(file_path), 0, Severity.MEDIUM,
-                    "React", "Component missing default export",
-                    "Add default export for React component"
-                )
-                
-            # Check for unused imports
-            import_lines = re.findall(r'import.*from.*', content)
-            for import_line in import_lines:
-                if 'React' in import_line and 'import React' in import_line:
-                    if 'React.' not in content and 'createElement' not in content:
-                        self._add_issue(
-                            str(file_path), 0, Severity.LOW,
-                            "React", "Unnecessary React import (using JSX transform)",
-                            "Remove explicit React import"
-                        )
-                        
-        except Exception:
-            pass
+            _write_bytes(str(self.root_path / RESULT_CACHE_FILE), payload)
+        except OSError:
+            # The cache only saves time; an unwritable tree is still audited
+            return
+        self._result_cache_dirty = False
     
-    def _check_react_hooks_usage(self):
-        """Check React Hooks usage patterns"""
-        print("🪝 Checking React Hooks...")
-        
-        client_dir = self.root_path / "client" / "src"
-        if not client_dir.exists():
+    def _check_file(self, file_path: str, is_client_tsx: bool, is_style: bool):
+        """Run the checks that apply to a single file"""
+        self._resolved_imports = []
+        self._missing_imports = []
+        try:
+            content = self._load(file_path)
+        except OSError:
+            return
+            
+        if is_style:
+            self._check_colors_in_css(file_path, content)
             return
             
-        for file_path in client_dir.rglob("*.tsx"):
-            self._check_hooks_in_file(file_path)
+        self._check_file_imports(file_path, content)
+        if is_client_tsx:
+            self._check_client_api_calls(file_path, content)
+            self._check_react_component(file_path, content)
+        self._scan_source_file(file_path, content, is_client_tsx)
+        self._check_colors_in_tsx(file_path, content)
+        self._check_env_vars_in_file(file_path, content)
     
-    def _check_hooks_in_file(self, file_path: Path):
-        """Check hooks usage in a specific file"""
+    def _check_client_api_calls(self, file_path: str, content: str):
+        """Check client-side API calls for consistency"""
         try:
-            with open(file_path) as f:
-                content = f.read()
-                
-            lines = content.split('\n')
+            # Find useQuery calls
+            queries = _QUERY_KEY_RE.findall(content)
             
-            # Check for hooks called conditionally
-            for i, line in enumerate(lines, 1):
-                if re.search(r'if.*use[A-Z]', line) or re.search(r'use[A-Z].*\?\s*', line):
+            for query in queries:
+                if not query.startswith('/api/'):
                     self._add_issue(
-                        str(file_path), i, Severity.HIGH,
-                        "React Hooks", "Hook called conditionally",
-                        "Move hook call outside conditional logic"
+                        file_path, 0, Severity.MEDIUM,
+                        "API Calls", f"Query key {query} doesn't follow /api/ convention",
+                        f"Update query key to start with /api/"
                     )
                     
-            # Check for missing dependencies in useEffect
-            useeffect_blocks = re.findall(r'useEffect\((.*?)\[(.*?)\]', content, re.DOTALL)
-            for block, deps in useeffect_blocks:
-                # Simple check for variables used in effect but not in deps
-                # This is a basic implementation
-                pass
-                
         except Exception:
             pass
     
-    def _check_type_safety(self):
-        """Check TypeScript type safety"""
-        print("🔒 Checking type safety...")
-        
-        for pattern in self.typescript_patterns:
-            for file_path in self.root_path.rglob(pattern):
-                if 'node_modules' in str(file_path):
-                    continue
-                self._check_types_in_file(file_path)
-    
-    def _check_types_in_file(self, file_path: Path):
-        """Check types in individual file"""
+    def _check_file_imports(self, file_path: str, content: str):
+        """Check individual file for import issues"""
         try:
-            with open(file_path) as f:
-                content = f.read()
-                
-            lines = content.split('\n')
+            line_number = 1
+            previous = 0
             
-            for i, line in enumerate(lines, 1):
-                line = line.strip()
-                
-                # Check for 'any' type usage
-                if re.search(r':\s*any\b', line) and not '// @ts-ignore' in line:
-                    self._add_issue(
-                        str(file_path), i, Severity.MEDIUM,
-                        "Type Safety", "Using 'any' type",
-                        "Replace 'any' with specific type"
+            # Check for invalid import paths on lines starting with 'import'
+            for position, import_path in scan_imports(content):
+                # Check relative imports
+                if import_path.startswith('./') or import_path.startswith('../'):
+                    # Resolve relative path against the file index
+                    base = os.path.normpath(os.path.join(os.path.dirname(file_path), import_path))
+                    stem = os.path.splitext(base)[0]
+                    possible_files = (
+                        base,
+                        stem + '.ts',
+                        stem + '.tsx',
+                        os.path.join(base, 'index.ts'),
+                        os.path.join(base, 'index.tsx')
                     )
                     
-                # Check for missing return types on functions
-                if re.search(r'function\s+\w+\([^)]*\)\s*{', line):
-                    if '):' not in line:
+                    # Only misses touch the filesystem, to cover targets
+                    # outside the indexed tree (excluded dirs, above root)
+                    found = next((p for p in possible_files if p in self._known_paths), None)
+                    if found is None:
+                        found = next((p for p in possible_files if os.path.exists(p)), None)
+                    if found is not None:
+                        # Remembered so a cached result is dropped if the target goes
+                        self._resolved_imports.append(found)
+                    else:
+                        # A miss can be fixed by creating any candidate, even in
+                        # an excluded dir, so all of them are re-probed later
+                        self._missing_imports.extend(possible_files)
+                        line_number += content.count('\n', previous, position)
+                        previous = position
                         self._add_issue(
-                            str(file_path), i, Severity.LOW,
-                            "Type Safety", "Function missing return type",
-                            "Add explicit return type to function"
+                            file_path, line_number, Severity.HIGH,
+                            "Imports", f"Import path not found: {import_path}",
+                            f"Fix import path or create missing file"
                         )
                         
         except Exception:
             pass
     
-    def _check_brand_color_compliance(self):
-        """Check brand color compliance"""
-        print("🎨 Checking brand color compliance...")
-        
-        # Check CSS files
-        for pattern in self.style_patterns:
-            for file_path in self.root_path.rglob(pattern):
-                self._check_colors_in_css(file_path)
-                
-        # Check TypeScript/JSX files for inline styles
-        for pattern in self.typescript_patterns:
-            for file_path in self.root_path.rglob(pattern):
-                if 'node_modules' in str(file_path):
-                    continue
-                self._check_colors_in_tsx(file_path)
-    
-    def _check_colors_in_css(self, file_path: Path):
-        """Check colors in CSS files"""
+    def _check_react_component(self, file_path: str, content: str):
+        """Check individual React component"""
         try:
-            with open(file_path) as f:
-                content = f.read()
+            # Check for proper default export
+            if 'export default' not in content:
+                self._add_issue(
+                    file_path, 0, Severity.MEDIUM,
+                    "React", "Component missing default export",
+                    "Add default export for React component"
+                )
                 
-            lines = content.split('\n')
-            
-            for i, line in enumerate(lines, 1):
-                for forbidden in self.forbidden_colors:
-                    if forbidden in line.lower():
+            # Check for unused imports. The file-level guards rule out most
+            # files before any line is scanned.
+            if ('import React' in content and 'React.' not in content
+                    and 'createElement' not in content):
+                position = content.find('import React')
+                while position != -1:
+                    line_start = content.rfind('\n', 0, position) + 1
+                    line_end = content.find('\n', position)
+                    if line_end == -1:
+                        line_end = len(content)
+                    line = content[line_start:line_end]
+                    
+                    # Only lines with an 'import ... from' clause count
+                    if line.find('from', line.find('import') + 6) != -1:
                         self._add_issue(
-                            str(file_path), i, Severity.MEDIUM,
-                            "Brand Colors", f"Non-brand color found: {forbidden}",
-                            f"Replace with brand colors: {list(self.brand_colors.values())}"
+                            file_path, 0, Severity.LOW,
+                            "React", "Unnecessary React import (using JSX transform)",
+                            "Remove explicit React import"
                         )
+                    position = content.find('import React', line_end)
                         
         except Exception:
             pass
     
-    def _check_colors_in_tsx(self, file_path: Path):
-        """Check colors in TSX files"""
+    def _scan_source_file(self, file_path: str, content: str, check_hooks: bool):
+        """Run the line-level source checks over a file in a single regex pass"""
         try:
-            with open(file_path) as f:
-                content = f.read()
+            for line_number, kind in scan_source(content, check_hooks):
+                severity, category, description, fix = _SOURCE_FINDINGS[kind]
+                self._add_issue(file_path, line_number, severity, category, description, fix)
                 
+        except Exception:
+            pass
+    
+    def _check_colors_in_css(self, file_path: str, content: str):
+        """Check colors in CSS files"""
+        try:
+            # Lower-case the whole file once rather than every line per color.
+            # Either way issues come out one per (line, color), in line order
+            # and then forbidden_colors order.
+            lowered = content.lower()
+            if self._color_automaton is not None:
+                matches = ((end, color_index)
+                           for end, indices in self._color_automaton.iter(lowered)
+                           for color_index in indices)
+            else:
+                matches = ((m.start(), color_index)
+                           for m in self._color_re.finditer(lowered)
+                           for color_index in self._color_prefixes[m.group(1)])
+            for i, color_index in color_hit_lines(lowered, matches):
+                self._add_issue(
+                    file_path, i, Severity.MEDIUM,
+                    "Brand Colors", f"Non-brand color found: {self.forbidden_colors[color_index]}",
+                    f"Replace with brand colors: {list(self.brand_colors.values())}"
+                )
+                        
+        except Exception:
+            pass
+    
+    def _check_colors_in_tsx(self, file_path: str, content: str):
+        """Check colors in TSX files"""
+        try:
             # Look for className with color classes
-            color_classes = re.findall(r'className=[\'"][^\'\"]*(?:bg-|text-|border-)(blue|red|green|yellow|purple|pink|indigo|violet)[^\'\"]*[\'"]', content)
+            color_classes = _TAILWIND_COLOR_RE.findall(content)
             
             for color_class in color_classes:
                 self._add_issue(
-                    str(file_path), 0, Severity.MEDIUM,
+                    file_path, 0, Severity.MEDIUM,
                     "Brand Colors", f"Non-brand Tailwind color: {color_class}",
                     "Replace with brand color classes or custom styles"
                 )
@@ -524,7 +822,7 @@ class ClinicalAppAuditor:
     
     def _check_configuration_files(self):
         """Check configuration files"""
-        print("⚙️ Checking configuration...")
+        logger.info("⚙️ Checking configuration...")
         
         # Check tsconfig.json
         tsconfig_path = self.root_path / "tsconfig.json"
@@ -545,8 +843,7 @@ class ClinicalAppAuditor:
     def _check_tsconfig(self, tsconfig_path: Path):
         """Check TypeScript configuration"""
         try:
-            with open(tsconfig_path) as f:
-                config = json.load(f)
+            config = self._load_json(tsconfig_path)
                 
             compiler_options = config.get('compilerOptions', {})
             
@@ -575,8 +872,7 @@ class ClinicalAppAuditor:
     def _check_package_scripts(self, package_path: Path):
         """Check package.json scripts"""
         try:
-            with open(package_path) as f:
-                package_data = json.load(f)
+            package_data = self._load_json(package_path)
                 
             scripts = package_data.get('scripts', {})
             
@@ -592,32 +888,18 @@ class ClinicalAppAuditor:
         except Exception:
             pass
     
-    def _check_environment_variables(self):
-        """Check environment variable usage"""
-        print("🌍 Checking environment variables...")
-        
-        # Look for process.env usage
-        for pattern in self.typescript_patterns:
-            for file_path in self.root_path.rglob(pattern):
-                if 'node_modules' in str(file_path):
-                    continue
-                self._check_env_vars_in_file(file_path)
-    
-    def _check_env_vars_in_file(self, file_path: Path):
+    def _check_env_vars_in_file(self, file_path: str, content: str):
         """Check environment variables in file"""
         try:
-            with open(file_path) as f:
-                content = f.read()
-                
             # Find process.env usage
-            env_vars = re.findall(r'process\.env\.([A-Z_]+)', content)
+            env_vars = _ENV_VAR_RE.findall(content)
             
             # Check for frontend env vars without VITE_ prefix
-            if 'client/src' in str(file_path):
+            if 'client/src' in file_path:
                 for var in env_vars:
                     if not var.startswith('VITE_'):
                         self._add_issue(
-                            str(file_path), 0, Severity.HIGH,
+                            file_path, 0, Severity.HIGH,
                             "Environment", f"Frontend env var {var} missing VITE_ prefix",
                             f"Rename to VITE_{var} or use import.meta.env"
                         )
@@ -625,47 +907,9 @@ class ClinicalAppAuditor:
         except Exception:
             pass
     
-    def _check_code_quality(self):
-        """Check general code quality issues"""
-        print("✨ Checking code quality...")
-        
-        for pattern in self.typescript_patterns:
-            for file_path in self.root_path.rglob(pattern):
-                if 'node_modules' in str(file_path):
-                    continue
-                self._check_quality_in_file(file_path)
-    
-    def _check_quality_in_file(self, file_path: Path):
-        """Check code quality in individual file"""
-        try:
-            with open(file_path) as f:
-                content = f.read()
-                
-            lines = content.split('\n')
-            
-            for i, line in enumerate(lines, 1):
-                # Check for console.log (should be removed in production)
-                if 'console.log' in line and '// @keep' not in line:
-                    self._add_issue(
-                        str(file_path), i, Severity.LOW,
-                        "Code Quality", "console.log found",
-                        "Remove console.log or replace with proper logging"
-                    )
-                    
-                # Check for TODO comments
-                if 'TODO' in line.upper() or 'FIXME' in line.upper():
-                    self._add_issue(
-                        str(file_path), i, Severity.LOW,
-                        "Code Quality", "TODO/FIXME comment found",
-                        "Complete or remove TODO/FIXME comment"
-                    )
-                    
-        except Exception:
-            pass
-    
     def _check_documentation(self):
         """Check documentation completeness"""
-        print("📚 Checking documentation...")
+        logger.info("📚 Checking documentation...")
         
         # Check for README
         readme_files = list(self.root_path.glob("README*"))
@@ -688,22 +932,22 @@ class ClinicalAppAuditor:
             fix_suggestion=fix_suggestion,
             code_snippet=code_snippet
         )
+        self._record_issue(issue)
+    
+    def _record_issue(self, issue: Issue):
+        """Append an issue to the results and its severity group"""
         self.results.issues.append(issue)
+        self._issues_by_severity[issue.severity].append(issue)
     
     def _calculate_results(self):
         """Calculate final audit results"""
         total_issues = len(self.results.issues)
         
-        # Count by severity
-        for issue in self.results.issues:
-            if issue.severity == Severity.CRITICAL:
-                self.results.critical_count += 1
-            elif issue.severity == Severity.HIGH:
-                self.results.high_count += 1
-            elif issue.severity == Severity.MEDIUM:
-                self.results.medium_count += 1
-            else:
-                self.results.low_count += 1
+        # Issues were grouped by severity as they were recorded
+        self.results.critical_count = len(self._issues_by_severity[Severity.CRITICAL])
+        self.results.high_count = len(self._issues_by_severity[Severity.HIGH])
+        self.results.medium_count = len(self._issues_by_severity[Severity.MEDIUM])
+        self.results.low_count = len(self._issues_by_severity[Severity.LOW])
         
         # Calculate pass rate (inverse of critical and high issues)
         critical_high = self.results.critical_count + self.results.high_count
@@ -712,83 +956,163 @@ class ClinicalAppAuditor:
         else:
             self.results.pass_rate = max(0, (total_issues - critical_high) / total_issues * 100)
     
-    def generate_report(self) -> str:
-        """Generate audit report"""
-        report = []
-        report.append("=" * 60)
-        report.append("🏥 CLINICAL APPLICATION AUDIT REPORT")
-        report.append("=" * 60)
-        report.append(f"📊 OVERALL PASS RATE: {self.results.pass_rate:.1f}%")
-        report.append("")
-        report.append(f"📈 ISSUE BREAKDOWN:")
-        report.append(f"   🔴 CRITICAL: {self.results.critical_count}")
-        report.append(f"   🟠 HIGH:     {self.results.high_count}")
-        report.append(f"   🟡 MEDIUM:   {self.results.medium_count}")
-        report.append(f"   🟢 LOW:      {self.results.low_count}")
-        report.append("")
+    def generate_report(self, out: Optional[TextIO] = None) -> Optional[str]:
+        """Generate audit report, streaming it to out if given, else returning it"""
+        # Without a writer, collect the pieces and join them once at the end
+        parts: List[str] = []
+        w = out.write if out is not None else parts.append
+        
+        w("=" * 60 + "\n")
+        w("🏥 CLINICAL APPLICATION AUDIT REPORT\n")
+        w("=" * 60 + "\n")
+        w(f"📊 OVERALL PASS RATE: {self.results.pass_rate:.1f}%\n")
+        w("\n")
+        w("📈 ISSUE BREAKDOWN:\n")
+        w(f"   🔴 CRITICAL: {self.results.critical_count}\n")
+        w(f"   🟠 HIGH:     {self.results.high_count}\n")
+        w(f"   🟡 MEDIUM:   {self.results.medium_count}\n")
+        w(f"   🟢 LOW:      {self.results.low_count}\n")
+        w("\n")
         
         if self.results.issues:
-            # Group by severity
-            issues_by_severity = {
-                Severity.CRITICAL: [],
-                Severity.HIGH: [],
-                Severity.MEDIUM: [],
-                Severity.LOW: []
-            }
-            
-            for issue in self.results.issues:
-                issues_by_severity[issue.severity].append(issue)
-            
-            for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW]:
-                issues = issues_by_severity[severity]
+            # Groups are keyed in Severity order, most severe first
+            for severity, issues in self._issues_by_severity.items():
                 if not issues:
                     continue
                     
-                icon = {"CRITICAL": "🔴", "HIGH": "🟠", "MEDIUM": "🟡", "LOW": "🟢"}[severity.value]
-                report.append(f"{icon} {severity.value} ISSUES ({len(issues)}):")
-                report.append("-" * 40)
+                w(f"{_SEVERITY_ICONS[severity]} {severity.name} ISSUES ({len(issues)}):\n")
+                w("-" * 40 + "\n")
                 
                 for i, issue in enumerate(issues, 1):
-                    report.append(f"{i}. {issue.file_path}:{issue.line_number}")
-                    report.append(f"   Category: {issue.category}")
-                    report.append(f"   Issue: {issue.description}")
-                    report.append(f"   Fix: {issue.fix_suggestion}")
+                    w(f"{i}. {issue.file_path}:{issue.line_number}\n"
+                      f"   Category: {issue.category}\n"
+                      f"   Issue: {issue.description}\n"
+                      f"   Fix: {issue.fix_suggestion}\n")
                     if issue.code_snippet:
-                        report.append(f"   Code: {issue.code_snippet}")
-                    report.append("")
+                        w(f"   Code: {issue.code_snippet}\n")
+                    w("\n")
                 
         else:
-            report.append("✅ No issues found!")
+            w("✅ No issues found!\n")
         
-        return "\n".join(report)
+        return "".join(parts) if out is None else None
     
     def generate_fixes(self) -> List[str]:
         """Generate automated fixes for issues"""
         fixes = []
         
-        # Sort issues by severity (critical first)
-        sorted_issues = sorted(self.results.issues, 
-                             key=lambda x: ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW'].index(x.severity.value))
+        # Only critical and high issues get fixes, and with none there is
+        # nothing to order or dispatch
+        critical = self._issues_by_severity[Severity.CRITICAL]
+        high = self._issues_by_severity[Severity.HIGH]
+        if not critical and not high:
+            return fixes
         
-        for issue in sorted_issues:
-            if issue.severity in [Severity.CRITICAL, Severity.HIGH]:
-                fix_command = self._generate_fix_command(issue)
-                if fix_command:
-                    fixes.append(fix_command)
+        # The severity groups keep recording order, so critical then high is
+        # exactly what a stable sort by severity would give
+        for issue in chain(critical, high):
+            fix_command = _generate_fix_command(issue.category, issue.description,
+                                                issue.file_path, issue.line_number)
+            if fix_command:
+                fixes.append(fix_command)
         
         return fixes
-    
-    def _generate_fix_command(self, issue: Issue) -> Optional[str]:
-        """Generate specific fix command for an issue"""
-        if issue.category == "TypeScript" and "Missing" in issue.description:
-            return f"# Fix missing dependency: {issue.description}"
-        elif issue.category == "Imports" and "not found" in issue.description:
-            return f"# Fix import path in {issue.file_path}:{issue.line_number}"
-        elif issue.category == "Brand Colors":
-            return f"# Update colors in {issue.file_path} to use brand palette"
-        
+
+def _fix_typescript(description: str, file_path: str, line_number: int) -> Optional[str]:
+    if "Missing" in description:
+        return f"# Fix missing dependency: {description}"
+    return None
+
+def _fix_import(description: str, file_path: str, line_number: int) -> Optional[str]:
+    if "not found" in description:
+        return f"# Fix import path in {file_path}:{line_number}"
+    return None
+
+def _fix_colors(description: str, file_path: str, line_number: int) -> Optional[str]:
+    return f"# Update colors in {file_path} to use brand palette"
+
+# Fix command builders by issue category; other categories get no fix command
+_FIX_HANDLERS = {
+    "TypeScript": _fix_typescript,
+    "Imports": _fix_import,
+    "Brand Colors": _fix_colors,
+}
+
+@lru_cache(maxsize=4096)
+def _generate_fix_command(category: str, description: str, file_path: str, line_number: int) -> Optional[str]:
+    """Generate specific fix command for an issue, memoized across audit iterations"""
+    handler = _FIX_HANDLERS.get(category)
+    if handler is None:
+        return None
+    return handler(description, file_path, line_number)
+
+def _checks_signature() -> List[int]:
+    """Return a value that changes whenever the auditor's own source changes"""
+    signature = []
+    for module_file in (__file__, sys.modules[scan_source.__module__].__file__):
+        st = os.stat(module_file)
+        signature += [st.st_mtime_ns, st.st_size]
+    return signature
+
+def _stat_key(file_path: str) -> Optional[Tuple[str, int, int]]:
+    """Return a key that changes whenever the file is modified, or None if it can't be stat'd"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (file_path, st.st_mtime_ns, st.st_size)
+
+def _read_source(file_path: str) -> str:
+    """Read a source file as text, dropping undecodable bytes and normalizing newlines"""
+    # One raw read and one decode of the whole buffer is cheaper than going
+    # through a text-mode file object; newlines are translated only when a
+    # file actually has carriage returns
+    with open(file_path, 'rb') as f:
+        content = f.read().decode('utf-8', errors='ignore')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+def _read_text(file_path: str) -> Optional[str]:
+    """Read a file the way ClinicalAppAuditor._load does, or None if it can't be read"""
+    try:
+        return _read_source(file_path)
+    except OSError:
         return None
 
+def _write_bytes(file_path: str, data: bytes):
+    """Replace a file's contents with data using raw os.write calls"""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+# Header printed before each audit iteration, encoded once; format with
+# (iteration, max_iterations)
+_ITERATION_BANNER = "\n🔄 AUDIT ITERATION %d/%d\n".encode('utf-8') + b"=" * 50 + b"\n"
+
+# Per-process auditor used by scan_file, installed by _init_scan_worker
+_worker_auditor: Optional[ClinicalAppAuditor] = None
+
+def _init_scan_worker(auditor: ClinicalAppAuditor):
+    global _worker_auditor
+    _worker_auditor = auditor
+
+def scan_file(job: Tuple[str, bool, bool], known_paths: set) -> FileResult:
+    """Run the per-file checks for one file in a worker process"""
+    auditor = _worker_auditor
+    auditor._known_paths = known_paths
+    # Issues are handed back to the parent, so each job gets a fresh list
+    auditor.results = AuditResults()
+    auditor._issues_by_severity = {s: [] for s in Severity}
+    auditor._file_cache = {}
+    auditor._check_file(*job)
+    return FileResult(auditor.results.issues, auditor._resolved_imports,
+                      auditor._missing_imports)
+
 def main():
     """Main execution function"""
     if len(sys.argv) > 1:
@@ -800,45 +1124,72 @@ def main():
     
     iteration = 1
     max_iterations = 5
+    previous_issues = None
+    # Report files are written on a background thread while the next
+    # iteration audits; each is confirmed, or its failure raised, once the
+    # loop is done
+    report_writer = ThreadPoolExecutor(max_workers=1)
+    report_writes = []
     
-    while iteration <= max_iterations:
-        print(f"\n🔄 AUDIT ITERATION {iteration}/{max_iterations}")
-        print("=" * 50)
-        
-        results = auditor.run_audit()
-        report = auditor.generate_report()
-        
-        print(report)
-        
-        # Save report to file
-        report_file = f"audit_report_iteration_{iteration}.txt"
-        with open(report_file, 'w') as f:
-            f.write(report)
+    try:
+        while iteration <= max_iterations:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(_ITERATION_BANNER % (iteration, max_iterations))
+            
+            results = auditor.run_audit()
+            
+            # Fixes are only suggested, never applied, so an unchanged issue set
+            # means every further iteration would repeat this one exactly
+            current_issues = sorted((i.file_path, i.line_number, i.description) for i in results.issues)
+            if current_issues == previous_issues:
+                print("⏹️ No fixes applied since the last iteration; stopping early")
+                break
+            previous_issues = current_issues
+            
+            report = auditor.generate_report()
+            
+            # Encode once and hand the same bytes to stdout and the report file,
+            # one write call each
+            report_bytes = report.encode('utf-8')
+            sys.stdout.flush()
+            sys.stdout.buffer.write(report_bytes)
+            sys.stdout.buffer.flush()
+            
+            # Save report to file
+            report_file = f"audit_report_iteration_{iteration}.txt"
+            report_writes.append((report_file,
+                                  report_writer.submit(_write_bytes, report_file, report_bytes)))
+            
+            # Check if we've reached 100% pass rate
+            if results.pass_rate >= 100.0:
+                print(f"🎉 SUCCESS! 100% pass rate achieved in {iteration} iterations!")
+                break
+            
+            # Generate and apply fixes
+            fixes = auditor.generate_fixes()
+            if fixes:
+                # One write for the whole list rather than a print per fix
+                sys.stdout.write(f"\n🔧 GENERATED {len(fixes)} FIXES:\n"
+                                 + "".join(f"   - {fix}\n" for fix in fixes))
+            
+            iteration += 1
+    
+    finally:
+        auditor.close()
+        report_writer.shutdown()
+    
+    for report_file, write in report_writes:
+        write.result()
         print(f"📄 Report saved to: {report_file}")
-        
-        # Check if we've reached 100% pass rate
-        if results.pass_rate >= 100.0:
-            print(f"🎉 SUCCESS! 100% pass rate achieved in {iteration} iterations!")
-            break
-        
-        # Generate and apply fixes
-        fixes = auditor.generate_fixes()
-        if fixes:
-            print(f"\n🔧 GENERATED {len(fixes)} FIXES:")
-            for fix in fixes:
-                print(f"   - {fix}")
-        
-        iteration += 1
-        
-        # Reset for next iteration
-        auditor.results = AuditResults()
     
     if results.pass_rate < 100.0:
-        print(f"\n⚠️  Audit completed with {results.pass_rate:.1f}% pass rate after {max_iterations} iterations")
+        iterations_run = min(iteration, max_iterations)
+        print(f"\n⚠️  Audit completed with {results.pass_rate:.1f}% pass rate after {iterations_run} iterations")
         print("Manual intervention may be required for remaining issues.")
     
     return results.pass_rate >= 100.0
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
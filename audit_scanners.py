@@ -0,0 +1,137 @@
+"""
+Line-level scanners for the clinical application audit.
+
+Pure, fully annotated functions over file content, kept apart from
+audit_application.py so they can be compiled ahead of time with mypyc:
+
+    mypyc audit_scanners.py
+
+Python imports the compiled extension in preference to this file when both
+sit in the same directory, so no code changes are needed to pick it up.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Line-level source probes fused into one pattern. Each branch consumes only
+# its first character and checks the rest in a lookahead, so a match never
+# swallows text another probe needs on the same line and the engine can skip
+# ahead on the leading-character set. Whitespace classes exclude '\n' so no
+# probe spans two lines.
+_PER_FILE_RE = re.compile(
+    r':(?=(?P<any>[^\S\n]*any\b))'
+    r'|f(?=(?P<fn_noret>unction[^\S\n]+\w+\([^)\n]*\)[^\S\n]*\{))'
+    r'|i(?=(?P<hook_if>f.*use[A-Z]))'
+    r'|u(?=(?P<hook_ternary>se[A-Z].*\?))'
+    r'|c(?=(?P<console>onsole\.log))'
+)
+# Per-line escapes: a probe hit is dropped when its line contains the marker
+_LINE_ESCAPES: Dict[str, str] = {
+    'any': '// @ts-ignore',
+    'fn_noret': '):',
+    'console': '// @keep',
+}
+# Case-insensitive TODO/FIXME, for text where lower() may not preserve offsets.
+# It is kept out of the fused pattern: t and f are common enough that trying
+# this branch at each of them dominated the whole scan.
+_TODO_RE = re.compile(r'[tTfF](?=(?<=[tT])(?i:odo)|(?<=[fF])(?i:ixme))')
+# First "from '<path>'" after an 'import'; line-start is checked by the caller
+# so the engine can search for the literal instead of trying every line
+_IMPORT_FROM_RE = re.compile(r'import[^\n]*?from [\'"]([^\'"\n]+)[\'"]')
+
+def scan_source(content: str, check_hooks: bool) -> List[Tuple[int, str]]:
+    """Return (line_number, kind) findings for the fused source probes
+
+    Kinds are 'any', 'fn_noret', 'hook', 'console' and 'todo'; each is
+    reported at most once per line.
+    """
+    findings: List[Tuple[int, str]] = []
+    reported: Set[Tuple[str, int]] = set()
+    # Matches arrive in offset order, so line numbers are carried forward
+    # by counting newlines between consecutive matches (in C, via
+    # str.count) instead of indexing every newline in the file
+    line_number = 1
+    previous = 0
+    # Text of the current line, sliced out only when a probe needs it and
+    # then shared by every later hit on the same line
+    line: Optional[str] = None
+
+    hits: List[Tuple[int, str]] = [
+        (match.start(), match.lastgroup or '') for match in _PER_FILE_RE.finditer(content)
+    ]
+    hits.extend((position, 'todo') for position in _todo_offsets(content))
+    hits.sort()
+
+    for position, kind in hits:
+        if kind.startswith('hook'):
+            if not check_hooks:
+                continue
+            kind = 'hook'
+
+        newlines = content.count('\n', previous, position)
+        previous = position
+        if newlines:
+            line_number += newlines
+            line = None
+        if (kind, line_number) in reported:
+            continue
+
+        escape = _LINE_ESCAPES.get(kind)
+        if escape is not None:
+            if line is None:
+                line_start = content.rfind('\n', 0, position) + 1
+                line_end = content.find('\n', position)
+                line = content[line_start:line_end if line_end != -1 else len(content)]
+            if escape in line:
+                continue
+
+        findings.append((line_number, kind))
+        reported.add((kind, line_number))
+
+    return findings
+
+
+def _todo_offsets(content: str) -> List[int]:
+    """Return the offset of every case-insensitive 'todo' and 'fixme'"""
+    if not content.isascii():
+        return [match.start() for match in _TODO_RE.finditer(content)]
+    # For ASCII text lower() keeps every offset, and str.find on the
+    # lowered copy beats a case-insensitive regex by a wide margin
+    lowered = content.lower()
+    offsets: List[int] = []
+    for word in ('todo', 'fixme'):
+        position = lowered.find(word)
+        while position != -1:
+            offsets.append(position)
+            position = lowered.find(word, position + 1)
+    return offsets
+
+
+def scan_imports(content: str) -> List[Tuple[int, str]]:
+    """Return (offset, path) for the first "from '<path>'" of each import line
+
+    An import line is one whose first non-blank word starts with 'import'.
+    """
+    imports: List[Tuple[int, str]] = []
+    for match in _IMPORT_FROM_RE.finditer(content):
+        position = match.start()
+        line_start = content.rfind('\n', 0, position) + 1
+        if line_start == position or content[line_start:position].isspace():
+            imports.append((position, match.group(1)))
+    return imports
+
+
+def color_hit_lines(lowered: str, hits: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Turn (offset, color_index) hits into sorted unique (line_number, color_index)
+
+    Hits must arrive in offset order, as an Aho-Corasick iteration or a regex
+    scan yields them; any offset inside the match will do.
+    """
+    found: Set[Tuple[int, int]] = set()
+    line_number = 1
+    previous = 0
+    for offset, color_index in hits:
+        line_number += lowered.count('\n', previous, offset)
+        previous = offset
+        found.add((line_number, color_index))
+    return sorted(found)